@@ -1,7 +1,7 @@
-import os
-import json
 from typing import List, Tuple, Optional
 
+from utils import load_json, save_json
+
 ORDER_FILE = "song_order.json"
 
 # Type alias: list of (song_number, title)
@@ -20,10 +20,10 @@ def load_song_order() -> Optional[SongList]:
     Load a previously saved song order as a list of (number, title) pairs.
     Returns None if no file exists.
     """
-    if not os.path.exists(ORDER_FILE):
+    try:
+        data = load_json(ORDER_FILE)
+    except FileNotFoundError:
         return None
-    with open(ORDER_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
     # Validate and clean
     if not all(isinstance(i, list) and len(i) == 2 for i in data):
         print("⚠️ Invalid format in saved order, ignoring file.")
@@ -35,8 +35,7 @@ def save_song_order(order: SongList) -> None:
     """
     Save the current song order (list of (number, title) pairs) to disk.
     """
-    with open(ORDER_FILE, "w", encoding="utf-8") as f:
-        json.dump(order, f, indent=2, ensure_ascii=False)
+    save_json(ORDER_FILE, order)
     print(f"✅ Song order saved to {ORDER_FILE}")
 
 
@@ -79,9 +78,10 @@ def alpha_order(songs):
     saved_order = load_song_order()
     if saved_order:
         print("✅ Using saved song order from file.")
-        # Map title to full tuple (handles full tuples with extra fields)
-        title_to_song = {song[1]: song for song in songs}
-        ordered = [title_to_song[t[1]] for t in saved_order if t[1] in title_to_song]
+        # Map title to full tuple (handles full tuples with extra fields);
+        # bind .get once so each saved title costs a single hash lookup
+        get_song = {song[1]: song for song in songs}.get
+        ordered = [song for song in map(get_song, (t[1] for t in saved_order)) if song is not None]
         return ordered
 
     print("⚠️ No saved order found — launching interactive reorder.")
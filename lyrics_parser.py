@@ -1,32 +1,58 @@
 import re
 import os
-import json
 
+from functools import lru_cache
 from typing import List, Dict
 
-# This can live in memory
-_lyrics_version_cache = {}
-CACHE_FILE = "version_choices.json"
+from utils import load_json, save_json
 
-# Load cache from disk if available
-if os.path.exists(CACHE_FILE):
-    with open(CACHE_FILE, "r", encoding="utf-8") as f:
-        _lyrics_version_cache = json.load(f)
+# Patterns are compiled once rather than looked up in the re cache on every call
+# Metadata lines (hashtags, Capo lines, copyright notices) are removed with their line break
+_META_LINE_RE = re.compile(r"^[^\S\n]*(?:#|capo|\(c\)).*(?:\n|\Z)", re.IGNORECASE | re.MULTILINE)
+_CHORD_RE = re.compile(r"\[.*?\]")
+_VERSION_HEADER_RE = re.compile(r"^###\s+(.+)$", re.MULTILINE)
 
-def clean_lyrics(text):
-    cleaned_lines = []
-    for line in text.splitlines():
-        stripped = line.strip()
-        # Skip metadata lines: hashtags, Capo lines, and copyright notices
-        if (stripped.startswith('#') or 
-            stripped.lower().startswith('capo') or 
-            re.match(r"^\(c\)", stripped, re.IGNORECASE)):
-            continue
-        # Remove chords in brackets but preserve whitespace
-        cleaned_line = re.sub(r"\[.*?\]", "", line)
-        cleaned_lines.append(cleaned_line.rstrip())  # preserve left spaces, trim right
+# This can live in memory; it is loaded from disk on first use, not at import
+_lyrics_version_cache = None
+_lyrics_version_cache_mtime = None
+CACHE_FILE = "version_choices.json"
 
-    return "\n".join(cleaned_lines).strip()
+def _get_version_cache():
+    """
+    Return the cached version choices, re-reading CACHE_FILE only when its
+    modification time differs from the last time it was read or written.
+    """
+    global _lyrics_version_cache, _lyrics_version_cache_mtime
+    try:
+        mtime = os.stat(CACHE_FILE).st_mtime_ns
+    except FileNotFoundError:
+        if _lyrics_version_cache is None:
+            _lyrics_version_cache = {}
+        return _lyrics_version_cache
+
+    if mtime != _lyrics_version_cache_mtime:
+        _lyrics_version_cache = load_json(CACHE_FILE)
+        _lyrics_version_cache_mtime = mtime
+    return _lyrics_version_cache
+
+def _save_version_cache(cache):
+    """Persist the version choices and remember the file's new modification time."""
+    global _lyrics_version_cache_mtime
+    save_json(CACHE_FILE, cache)
+    _lyrics_version_cache_mtime = os.stat(CACHE_FILE).st_mtime_ns
+
+# Lyrics are pure inputs, so repeated songs (and reruns in one session) hit the cache
+@lru_cache(maxsize=2048)
+def clean_lyrics(text):
+    # Normalise every line break splitlines() knows (\r, \r\n, \x0c, \u2028, ...)
+    # to \n first, since the regexes below only treat \n as a line boundary
+    text = "\n".join(text.splitlines())
+    # Drop metadata lines and chords with one pass each over the whole text,
+    # then trim trailing whitespace per line (left spaces mark choruses)
+    text = _META_LINE_RE.sub("", text)
+    if "[" in text:  # C-level scan; chord-free lyrics skip the regex entirely
+        text = _CHORD_RE.sub("", text)
+    return "\n".join(line.rstrip() for line in text.splitlines()).strip()
 
 def parse_lyrics_sections(text: str) -> List[Dict]:
     """
@@ -45,77 +71,82 @@ def parse_lyrics_sections(text: str) -> List[Dict]:
     """
     sections = []
     lines = text.splitlines()
+    lines.append("")  # A trailing empty line flushes the final section inside the loop
 
     # Trackers for numbering and section content
     stanza_number = 0
     chorus_number = 0
-    current_block = []  # Accumulates lines of the current section
-    current_type = None  # 'stanza' or 'chorus'
-
-    def flush_block():
-        """Finalize and store the current block of lines, labeled by type."""
-        nonlocal current_block, current_type, stanza_number, chorus_number
-        if not current_block:
-            return
-        
-        content = "\n".join(current_block).strip()
-        if current_type == "stanza":
-            stanza_number += 1
-            sections.append({
-                "type": "stanza",
-                "number": stanza_number,
-                "content": content
-            })
-        elif current_type == "chorus":
-            chorus_number += 1
-            sections.append({
-                "type": "chorus",
-                "number": chorus_number,
-                "content": content
-            })
-        
-        # Reset the block after storing
-        current_block = []
-
-    # Iterate through each line of the lyrics
-    for line in lines:
-        stripped = line.strip()
-
-        # Detect a stanza marker (just a number)
-        if re.match(r"^\d+$", stripped):
-            flush_block()         # End previous section
-            current_type = "stanza"
-            continue              # Skip the marker itself
-
-        # Empty line → signals section boundary
-        if stripped == "":
-            flush_block()
+    block_start = None  # Index of the first line of the current section
+    is_chorus = False  # Type of the current section, decided by its first line
+
+    for i, line in enumerate(lines):
+        # Empty lines and stanza markers (just a number) end the current section.
+        # Only lines ending in whitespace or a digit can be either, so ordinary
+        # lyric lines skip the strip() allocation altogether
+        last_char = line[-1:]
+        if not last_char or last_char.isspace() or last_char.isdecimal():
+            stripped = line.strip()
+            ends_section = not stripped or stripped.isdecimal()
+        else:
+            ends_section = False
+
+        if ends_section:
+            if block_start is not None:
+                if is_chorus:
+                    chorus_number += 1
+                    number = chorus_number
+                else:
+                    stanza_number += 1
+                    number = stanza_number
+                sections.append({
+                    "type": "chorus" if is_chorus else "stanza",
+                    "number": number,
+                    # Sections are contiguous, so slice them out instead of collecting lines
+                    "content": "\n".join(lines[block_start:i]).strip()
+                })
+                block_start = None
             continue
 
-        # Check if line is indented (indicates chorus)
-        is_indented = bool(re.match(r"^\s{2,}\S", line))
+        # A section starting with an indented line (2+ spaces) is a chorus
+        if block_start is None:
+            block_start = i
+            is_chorus = line[:2].isspace()
 
-        # If we're starting a new section, decide type based on indentation
-        if not current_block:
-            current_type = "chorus" if is_indented else "stanza"
+    return chorus_number, sections
 
-        current_block.append(line)
+def parse_and_clean(text: str):
+    """
+    Clean raw lyrics and split them into sections in one call.
+    Equivalent to parse_lyrics_sections(clean_lyrics(text)); cleaning stays a
+    whole-text regex pass, which is as fast as a hand-fused per-line loop.
+    """
+    return parse_lyrics_sections(clean_lyrics(text))
 
-    flush_block()  # Final section flush at EOF
-    return chorus_number, sections
+@lru_cache(maxsize=2048)
+def _find_version_headers(lyrics):
+    """
+    Return the '### ' version header matches in lyrics (cached per lyrics text),
+    plus a map from header name to its position (first occurrence wins).
+    """
+    headers = tuple(_VERSION_HEADER_RE.finditer(lyrics))
+    header_index = {}
+    for i, match in enumerate(headers):
+        header_index.setdefault(match.group(1), i)
+    return headers, header_index
 
 def choose_lyrics_version(song_title, lyrics, persist=True):
     """
     Choose a version of lyrics if multiple are found (based on '### ' headers).
     Caches user choice by song title.
     """
-    headers = list(re.finditer(r'^###\s+(.+)$', lyrics, re.MULTILINE))
-    
+    headers, header_index = _find_version_headers(lyrics)
+
     if not headers:
         return lyrics  # No versions to choose
 
-    if song_title in _lyrics_version_cache:
-        chosen_header = _lyrics_version_cache[song_title]
+    version_cache = _get_version_cache()
+    if song_title in version_cache:
+        chosen_header = version_cache[song_title]
         print(f"✅ Using cached version for '{song_title}': {chosen_header}")
     else:
         print(f"\n🎵 Song: {song_title}")
@@ -133,14 +164,13 @@ def choose_lyrics_version(song_title, lyrics, persist=True):
             print("Invalid choice. Try again.")
 
         chosen_header = headers[choice].group(1)
-        _lyrics_version_cache[song_title] = chosen_header
+        version_cache[song_title] = chosen_header
 
         if persist:
-            with open(CACHE_FILE, "w", encoding="utf-8") as f:
-                json.dump(_lyrics_version_cache, f, indent=2, ensure_ascii=False)
+            _save_version_cache(version_cache)
 
     # Extract the selected version block
-    selected_index = next(i for i, h in enumerate(headers) if h.group(1) == chosen_header)
+    selected_index = header_index[chosen_header]
     start = headers[selected_index].end()
     end = headers[selected_index + 1].start() if selected_index + 1 < len(headers) else len(lyrics)
 
@@ -1,5 +1,6 @@
 import os
 import platform
+import subprocess
 import sys
 import traceback
 
@@ -17,6 +18,32 @@ except ImportError:
     sys.exit(1)
 
 
+def _launch(command, path):
+    """Start command on path without a shell, detached from our stdout/stderr."""
+    subprocess.Popen([command, path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _open_on_linux(path):
+    try:
+        # Most standard Linux desktop command
+        _launch("xdg-open", path)
+    except OSError:
+        try:
+            # Fallback for WSL
+            _launch("wslview", path)
+        except OSError:
+            # Headless boxes and containers have neither; the deck is built regardless
+            print("Could not open the presentation automatically; open it from the path above.")
+
+
+# Pick the platform's "open with default app" command once, at import
+_open_file = {
+    "Windows": lambda path: os.startfile(path),  # type: ignore
+    "Darwin": lambda path: _launch("open", path),  # macOS
+    "Linux": _open_on_linux,
+}.get(platform.system(), lambda path: None)
+
+
 def main():
     try:
         # 1. Run your song parsing logic
@@ -41,7 +68,8 @@ def main():
                 print(t[0], t[1], t[2])
             return
 
-        song_list = [(num, name) for num, name, *_ in cleaned_tuples]
+        # (number, title) pairs; slicing skips the starred unpack's throwaway list
+        song_list = [song[:2] for song in cleaned_tuples]
         print("Alphabetizing song list...")
         alpha_ordered_songs = alpha_order(song_list)
 
@@ -64,18 +92,7 @@ def main():
         # 5. Open the file (your auto-open logic)
         full_path = os.path.abspath(path)
         print(f"✅ PowerPoint created: {full_path}")
-
-        if platform.system() == "Windows":
-            os.startfile(full_path) # type: ignore
-        elif platform.system() == "Darwin":  # macOS
-            os.system(f"open \"{full_path}\"")
-        elif platform.system() == "Linux":
-            try:
-                # Most standard Linux desktop command
-                os.system(f"xdg-open \"{full_path}\"")
-            except Exception:
-                # Fallback for WSL
-                os.system(f"wslview \"{full_path}\"")
+        _open_file(full_path)
 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
@@ -1,9 +1,8 @@
-import json
-import os
 import re
 import unicodedata
 from difflib import SequenceMatcher
-from lyrics_parser import choose_lyrics_version, clean_lyrics, parse_lyrics_sections
+from lyrics_parser import choose_lyrics_version, parse_and_clean
+from utils import load_json, save_json
 
 # -------------------------
 # Utility Functions
@@ -13,18 +12,14 @@ CACHE_FILE = "selected_songs.json"
 
 def load_saved_choices():
     """Load the local JSON cache to skip re-asking about previously resolved songs."""
-    if not os.path.exists(CACHE_FILE):
-        return {}
     try:
-        with open(CACHE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        return load_json(CACHE_FILE)
+    except Exception:  # Missing or unreadable cache: start fresh
         return {}
 
 def save_saved_choices(cache):
     """Write user selections to disk to persist display titles and song IDs."""
-    with open(CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache, f, indent=2, ensure_ascii=False)
+    save_json(CACHE_FILE, cache)
 
 
 def normalize(s):
@@ -115,12 +110,13 @@ def match_targets_to_library(song_json_path, targets_txt_path):
     2. Substring matching in titles/lyrics.
     3. Fuzzy score comparison for typos.
     """
-    with open(song_json_path, "r", encoding="utf-8") as f:
-        full_data = json.load(f)
-        songs = full_data["songs"]
-        # Assumes the first book in the list provides the hymn number mapping
-        hymn_map = build_hymn_number_map(full_data["books"][0]["songs"])
-        song_id_map = {song["id"]: song for song in songs}
+    # One binary read + parse of the whole library (orjson when installed);
+    # every song is needed for the title/lyrics and fuzzy stages below
+    full_data = load_json(song_json_path)
+    songs = full_data["songs"]
+    # Assumes the first book in the list provides the hymn number mapping
+    hymn_map = build_hymn_number_map(full_data["books"][0]["songs"])
+    song_id_map = {song["id"]: song for song in songs}
 
     parsed_targets = load_target_songs(targets_txt_path)
     matched_song_ids = set() # Prevent the same song from being picked twice in one run
@@ -348,8 +344,7 @@ def structure_matched_lyrics(result, repeat_choruses=True):
 
         # Parse raw string into structured list of sections
         lyrics_chosen = choose_lyrics_version(title, lyrics_raw)
-        lyrics = clean_lyrics(lyrics_chosen)
-        num_choruses, parsed_lyrics = parse_lyrics_sections(lyrics)
+        num_choruses, parsed_lyrics = parse_and_clean(lyrics_chosen)
 
         # Handle automatic chorus repetition logic
         lyrics_to_output = parsed_lyrics
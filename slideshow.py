@@ -1,12 +1,68 @@
 # slideshow.py
+import zipfile
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional, Any
 from pptx import Presentation
 from pptx.util import Inches, Pt, Length
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import PP_ALIGN, MSO_VERTICAL_ANCHOR
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.shapes.shared import BaseShapeElement, CT_NonVisualDrawingProps
+from pptx.parts.slide import SlidePart
+from pptx.shapes.shapetree import BaseShapeFactory
 from pptx.slide import Slide
 
-from utils import calculate_dynamic_font_size, estimate_wrapped_lines
+from utils import count_visual_lines, font_size_for_lines
+
+try:
+    from isal import isal_zlib  # Optional: SIMD-accelerated deflate for saving the deck
+except ImportError:
+    isal_zlib = None
+
+# Top-level shape elements this module adds to slides
+_SHAPE_TAGS = (qn("p:sp"), qn("p:pic"))
+# Run text; templates are patched by walking these rather than through python-pptx's properties
+_TEXT_TAG = qn("a:t")
+
+@lru_cache(maxsize=256)
+def _section_label(is_chorus: bool, number: int, number_choruses: bool) -> str:
+    """Header label for a section; the same few labels repeat on every song, so they are cached."""
+    if is_chorus:
+        return f"CHORUS {number}" if number_choruses else "CHORUS"
+    return f"STANZA {number}"
+
+@contextmanager
+def _fast_deflate(level: int = 1):
+    """
+    Make ZipFiles opened inside the block default to a cheap deflate level.
+    python-pptx always writes at zlib's default (6), which is mostly CPU time for a
+    deck that is almost all repetitive slide XML; level 1 is several times faster.
+    When isal is installed, zipfile's compressor is also swapped for its zlib
+    drop-in (level 1 is valid there too), which deflates faster still.
+    Both patches are process-wide while the block runs: other ZipFiles opened
+    meanwhile also default to level 1 and (de)compress through isal, which
+    reads and writes the same deflate streams. Both are restored on exit.
+    """
+    original_init = zipfile.ZipFile.__init__
+    original_zlib = zipfile.zlib
+
+    def init(self, *args, **kwargs):
+        kwargs.setdefault("compresslevel", level)
+        original_init(self, *args, **kwargs)
+
+    zipfile.ZipFile.__init__ = init
+    if isal_zlib:
+        zipfile.zlib = isal_zlib
+    try:
+        yield
+    finally:
+        zipfile.ZipFile.__init__ = original_init
+        zipfile.zlib = original_zlib
 
 class LyricsSlideshow:
     def __init__(self, config: Dict[str, Any]) -> None:
@@ -24,25 +80,120 @@ class LyricsSlideshow:
         self.prs.slide_height = self.config["POSITION"]["slide_height"]
         self.blank_layout = self.prs.slide_layouts[6]
 
-    def _add_icon(self, slide: Slide, target_slide: Optional[Slide], icon_path: str, icon_type: str) -> None:
-        """Add a clickable icon to the slide."""
-        width, height = self.config["ICON_SIZES"][icon_type]
-        left, top = self.config["ICON_POSITIONS"][icon_type]
+        # Slides are only ever appended, so the next slide partname and id are counted
+        # here rather than rediscovered by python-pptx on every add (see _add_slide).
+        # That goes through python-pptx internals (as do _insert_clone and _link_to_slide),
+        # tested with the python-pptx pinned in requirements.txt; a version lacking any
+        # of them gets the public slides.add_slide instead
+        self._sldIdLst = self.prs._element.get_or_add_sldIdLst()
+        self._direct_slides = (hasattr(self.prs.part.rels, "_add_relationship")
+                               and hasattr(SlidePart, "new")
+                               and hasattr(self._sldIdLst, "_add_sldId")
+                               and hasattr(type(self._sldIdLst), "_next_id"))
+        self._next_slide_number = len(self._sldIdLst) + 1
+        self._next_slide_id = self._sldIdLst._next_id if self._direct_slides else None
+        # Likewise for the index links written by _link_to_slide
+        self._direct_links = (hasattr(self.prs.part.rels, "_add_relationship")
+                              and hasattr(BaseShapeElement, "_nvXxPr")
+                              and hasattr(CT_NonVisualDrawingProps, "get_or_add_hlinkClick"))
+        # The blank layout has nothing for new slides to copy (its date, footer and
+        # slide-number placeholders are not cloned), so find that out once
+        self._layout_has_placeholders = any(True for _ in self.blank_layout.iter_cloneable_placeholders())
+
+        # Slides inherit their background from the layout, so set it once here
+        # instead of writing a fill into every slide
+        self.blank_layout.background.fill.solid()
+        self.blank_layout.background.fill.fore_color.rgb = self.config["COLOR"]["bg"]
+
+        # The header strip overhangs the header text boxes slightly
+        self._header_strip_height = self.config["POSITION"]["header_height"] + Inches(0.1)
+
+        # Fully styled header strip, built on first use and cloned afterwards
+        self._header_sp_template = None
+        # Icon picture elements and their shared image parts, keyed on (icon_path, icon_type)
+        self._icon_templates = {}
+        # Index grid box, built on first use and cloned afterwards
+        self._grid_box_template = None
+        # Styled text boxes keyed on everything except their text (see _add_text_box)
+        self._textbox_templates = {}
+
+    def _add_slide(self) -> Slide:
+        """
+        Append a blank-layout slide, as prs.slides.add_slide would.
+        python-pptx scans every existing slide relationship and slide id for each new
+        slide, which makes building a large deck quadratic; a brand-new slide part
+        cannot already be related, so its relationship is added directly.
+        """
+        if not self._direct_slides:
+            return self.prs.slides.add_slide(self.blank_layout)
+
+        prs_part = self.prs.part
+        partname = PackURI("/ppt/slides/slide%d.xml" % self._next_slide_number)
+        slide_part = SlidePart.new(partname, prs_part.package, self.blank_layout.part)
+        rId = prs_part.rels._add_relationship(RT.SLIDE, slide_part)
+        slide = slide_part.slide
+        if self._layout_has_placeholders:
+            slide.shapes.clone_layout_placeholders(self.blank_layout)
+        self._sldIdLst._add_sldId(id=self._next_slide_id, rId=rId)
+        self._next_slide_number += 1
+        self._next_slide_id += 1
+        return slide
+
+    def _insert_clone(self, slide: Slide, template) -> object:
+        """Insert a copy of a prebuilt shape element into the slide and return the shape."""
+        shapes = slide.shapes
+        spTree = shapes._spTree
+        element = deepcopy(template)
+
+        # Shape ids must be unique per slide (nvXxPr/cNvPr/@id). Every slide here is built
+        # by appending shapes, so the last shape holds the highest id; python-pptx would
+        # scan every id on the slide, which is quadratic on the big index slides
+        last = spTree[-1]
+        shape_id = last[0][0].id + 1 if last.tag in _SHAPE_TAGS else shapes._next_shape_id
+        # The copy keeps the template's name prefix but is numbered from its new id,
+        # as python-pptx names new shapes ("Rectangle 4" for id 5), so names stay unique too
+        cNvPr = element[0][0]
+        cNvPr.id = shape_id
+        cNvPr.name = "%s %d" % (cNvPr.name.rpartition(" ")[0], shape_id - 1)
+        spTree.insert_element_before(element, "p:extLst")
+
+        # Templates are never placeholders, so skip the slide factory's placeholder check
+        return BaseShapeFactory(element, shapes)
+
+    def _add_icon(self, slide: Slide, target_slide: Optional[Slide], icon_path: str, icon_type: str) -> Optional[object]:
+        """Add a clickable icon to the slide. Returns the picture, or None if it could not be added."""
         try:
-            pic = slide.shapes.add_picture(icon_path, left, top, width=width, height=height)
+            cached = self._icon_templates.get((icon_path, icon_type))
+            if cached is None:
+                width, height = self.config["ICON_SIZES"][icon_type]
+                left, top = self.config["ICON_POSITIONS"][icon_type]
+                pic = slide.shapes.add_picture(icon_path, left, top, width=width, height=height)
+                # Later slides relate to the same image part instead of re-reading
+                # and re-hashing the file, and clone the picture element
+                image_part = slide.part.related_part(pic._element.blip_rId)
+                self._icon_templates[(icon_path, icon_type)] = (deepcopy(pic._element), image_part)
+            else:
+                template, image_part = cached
+                pic = self._insert_clone(slide, template)
+                pic._element.blipFill.blip.rEmbed = slide.part.relate_to(image_part, RT.IMAGE)
             if target_slide:
                 pic.click_action.target_slide = target_slide
+            return pic
         except Exception as e:
             print(f"⚠️ Error adding {icon_type} icon ({icon_path}): {e}")
+            return None
 
     def _add_header_background(self, slide: Slide) -> object:
         """Adds a colored header background strip."""
+        if self._header_sp_template is not None:
+            return self._insert_clone(slide, self._header_sp_template)
+
         shape = slide.shapes.add_shape(
             MSO_SHAPE.RECTANGLE,
             Length(0),  # Left
             self.config["POSITION"]["bottom_margin"],
             self.config["POSITION"]["slide_width"],
-            self.config["POSITION"]["header_height"] + Inches(0.1)
+            self._header_strip_height
         )
         fill = shape.fill
         if self.config["backheadfil"] == "y":
@@ -51,11 +202,12 @@ class LyricsSlideshow:
         else:
             shape.fill.background()
         shape.line.fill.background()  # No border
+        self._header_sp_template = deepcopy(shape._element)
         return shape
 
     def _add_text_box(self,
                       slide: Slide,
-                      text: str,
+                      text: Optional[str],
                       left: Length,
                       top: Length,
                       width: Length,
@@ -65,54 +217,143 @@ class LyricsSlideshow:
                       vertical_alignment=MSO_VERTICAL_ANCHOR.MIDDLE,
                       font_type: str = "body",
                       is_chorus: bool = False,
-                      is_header: bool = False) -> object:
-        """Add a formatted text box with optional dynamic sizing."""
+                      is_header: bool = False,
+                      lines: Optional[List[str]] = None) -> object:
+        """
+        Add a formatted text box with optional dynamic sizing.
+        Header boxes get the header font and colour; callers pass header text already uppercased.
+        Callers that already hold the text as a list of lines can pass it as lines
+        (and text=None) instead of joining it only to have it split again here.
+        """
+        # Split text into lines and add each line as a separate paragraph
+        if lines is None:
+            lines = text.split('\n')
+
+        # Use dynamic font size if none is provided
+        if font_size is None:
+            font_size = font_size_for_lines(count_visual_lines(lines), is_chorus)
+
+        # Boxes with the same geometry, styling and empty-line layout differ only in
+        # their run text, so later ones are cloned from the first and the text patched.
+        # Lines with control characters go through python-pptx, which escapes them.
+        plain = all(map(str.isprintable, lines))
+        if plain:
+            key = (left, top, width, height, font_size, horizontal_alignment, vertical_alignment,
+                   font_type, is_chorus, is_header, tuple(map(bool, lines)))
+            template = self._textbox_templates.get(key)
+            if template is not None:
+                shape = self._insert_clone(slide, template)
+                # One pass over the copy's a:t elements; empty lines have no run
+                for t, line in zip(shape._element.iter(_TEXT_TAG), filter(None, lines)):
+                    t.text = line
+                return shape
+
         shape = slide.shapes.add_textbox(left, top, width, height)
         text_frame = shape.text_frame
         text_frame.word_wrap = True
         text_frame.auto_size = None  # Let text wrap within the box
         text_frame.vertical_anchor = vertical_alignment
 
-        # Split text into lines and add each line as a separate paragraph
-        lines = text.split('\n')
-
-        # Use dynamic font size if none is provided
-        if font_size is None:
-            font_size = calculate_dynamic_font_size(text, is_chorus)
-
-        # Helper to apply font styles
-        def style_font(run, italic=False, header=False):
-            run.font.size = font_size
-            run.font.name = self.config["FONT"]["header"] if header else self.config["FONT"][font_type]
-            run.font.color.rgb = self.config["COLOR"]["header_text"] if header else self.config["COLOR"]["text"]
-            run.font.italic = italic
-
-        # First paragraph
-        first_para = text_frame.paragraphs[0]
-        first_para.text = lines[0].upper() if is_header else lines[0]
-        first_para.alignment = horizontal_alignment
-        first_para.line_spacing = 1.0
-        
-        if first_para.runs:
-             style_font(first_para.runs[0], italic=is_chorus, header=is_header)
-
-        # Remaining paragraphs
-        for line in lines[1:]:
-            para = text_frame.add_paragraph()
-            para.text = line.upper() if is_header else line
+        # Build the run properties once and give each run its own copy, instead of
+        # going through the font setters (size, name, color, italic) per run
+        font_name = self.config["FONT"]["header"] if is_header else self.config["FONT"][font_type]
+        font_color = self.config["COLOR"]["header_text"] if is_header else self.config["COLOR"]["text"]
+        rPr = parse_xml(
+            f'<a:rPr {nsdecls("a")} sz="{font_size.centipoints}" i="{int(is_chorus)}">'
+            f'<a:solidFill><a:srgbClr val="{font_color}"/></a:solidFill><a:latin/></a:rPr>'
+        )
+        rPr[1].set("typeface", font_name)  # Set through lxml so the name is escaped
+
+        # One paragraph per line; the first already exists in a new text box. All
+        # paragraphs share their formatting, so once an empty and a non-empty one have
+        # been built, further plain lines are copies of them with the text swapped
+        txBody = text_frame._txBody
+        paragraph_templates = {}
+        for i, line in enumerate(lines):
+            template = paragraph_templates.get(bool(line))
+            if template is not None:
+                p = deepcopy(template)
+                if line:
+                    next(p.iter(_TEXT_TAG)).text = line
+                txBody.append(p)
+                continue
+
+            para = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
+            para.text = line
             para.alignment = horizontal_alignment
             para.line_spacing = 1.0
             if para.runs:
-                style_font(para.runs[0], italic=is_chorus, header=is_header)
-        
+                para.runs[0]._r.insert(0, deepcopy(rPr))
+            if plain:
+                paragraph_templates[bool(line)] = para._p
+
+        if plain:
+            self._textbox_templates[key] = deepcopy(shape._element)
         return shape
 
+    def _add_grid_box(self, slide: Slide, left: Length, top: Length, title: str) -> object:
+        """Add one outlined, left-aligned title box of an index slide grid."""
+        # Every box shares its size and styling, so later boxes clone the first one
+        # (renumbered and renamed by _insert_clone, so each box stays 'Rectangle N')
+        # and only move it and swap its text; titles with control characters are
+        # written through python-pptx, which escapes them
+        plain = title.isprintable()
+        if plain and self._grid_box_template is not None:
+            shape = self._insert_clone(slide, self._grid_box_template)
+            element = shape._element
+            offset = element.spPr.xfrm.off
+            offset.x = left
+            offset.y = top
+            next(element.iter(_TEXT_TAG)).text = title
+            return shape
+
+        grid = self.config["GRID"]
+        shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, grid["box_width"], grid["box_height"])
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = self.config["COLOR"]["header_bg"]
+        shape.line.color.rgb = self.config["COLOR"]["text"]
+        shape.line.width = Pt(0.75)
+
+        text_frame = shape.text_frame
+        text_frame.text = title
+        text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
+        text_frame.word_wrap = True
+
+        p = text_frame.paragraphs[0]
+        p.alignment = PP_ALIGN.LEFT
+        run = p.runs[0]
+        run.font.size = self.config["SIZE"]["song_list"]
+        run.font.name = self.config["FONT"]["body"]
+        run.font.color.rgb = self.config["COLOR"]["text"]
+
+        if plain:
+            self._grid_box_template = deepcopy(shape._element)
+        return shape
+
+    def _link_to_slide(self, shape: object, target_slide: Slide, slide_rIds: Dict[Any, str]) -> None:
+        """
+        Make a click on shape jump to target_slide, as click_action.target_slide does.
+        python-pptx looks for an existing relationship by regrouping all of the slide's
+        relationships on every link, which is quadratic on an index slide; slide_rIds
+        remembers the rId per target for the slide being linked, so each link is O(1).
+        Falls back to click_action.target_slide if python-pptx lacks the internals used.
+        """
+        if not self._direct_links:
+            shape.click_action.target_slide = target_slide
+            return
+
+        target_part = target_slide.part
+        rId = slide_rIds.get(target_part)
+        if rId is None:
+            rId = slide_rIds[target_part] = shape.part.rels._add_relationship(RT.SLIDE, target_part)
+        hlink = shape._element._nvXxPr.cNvPr.get_or_add_hlinkClick()
+        hlink.action = "ppaction://hlinksldjump"
+        hlink.rId = rId
+
     def _add_title_slide(self) -> Slide:
         """Creates and adds the main title slide."""
-        slide = self.prs.slides.add_slide(self.blank_layout)
-        slide.background.fill.solid()
-        slide.background.fill.fore_color.rgb = self.config["COLOR"]["bg"]
-        
+        slide = self._add_slide()
+
         self._add_text_box(
             slide=slide,
             text="Song Lyrics Slideshow",
@@ -125,59 +366,56 @@ class LyricsSlideshow:
         )
         return slide
 
+    def _add_index_slide(self, entries: List[Tuple[str, Optional[Slide]]]) -> Slide:
+        """
+        Creates an index slide: a grid of (title, target slide) entries, each box
+        linked to its slide; entries without a target slide are listed unlinked.
+        """
+        slide = self._add_slide()
+        background_fill = slide.background.fill
+        background_fill.solid()
+        background_fill.fore_color.rgb = self.config["COLOR"]["header_bg"]
+
+        # Grid configuration
+        grid = self.config["GRID"]
+        num_columns = grid["columns"]
+        # Plain-int strides, so the loop does one multiply-add per coordinate
+        start_left, start_top = int(grid["start_left"]), int(grid["start_top"])
+        column_step = int(grid["box_width"] + grid["spacing_x"])
+        row_step = int(grid["box_height"] + grid["spacing_y"])
+        slide_rIds = {}  # Slide part -> rId of this slide's link to it
+
+        for index, (full_title, target_slide) in enumerate(entries):
+            row, col = divmod(index, num_columns)
+            shape = self._add_grid_box(slide, start_left + col * column_step, start_top + row * row_step, full_title)
+            if target_slide is not None:
+                self._link_to_slide(shape, target_slide, slide_rIds)
+
+        return slide
+
     def _add_song_list_slide(self,
                              song_titles: List[str],
                              song_slide_map: Dict[int, Slide]
                              ) -> Tuple[Slide, Dict[int, int]]:
         """Creates a slide listing all songs with clickable links."""
-        slide = self.prs.slides.add_slide(self.blank_layout)
-        slide.background.fill.solid()
-        slide.background.fill.fore_color.rgb = self.config["COLOR"]["header_bg"]
-
-        # Grid configuration
-        grid = self.config["GRID"]
-        num_columns = grid["columns"]
-        box_width = grid["box_width"]
-        box_height = grid["box_height"]
-        
+        entries = []
         number_index_map = {}
 
         for index, title in enumerate(song_titles):
-            col = index % num_columns
-            row = index // num_columns
             song_number = index + 1
             num_str = f"{song_number:2}"  # Aligns 1-9 and 10+
             full_title = f"{num_str} – {title}"
 
-            left = grid["start_left"] + col * (box_width + grid["spacing_x"])
-            top = grid["start_top"] + row * (box_height + grid["spacing_y"])
-
-            shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, box_width, box_height)
-            shape.fill.solid()
-            shape.fill.fore_color.rgb = self.config["COLOR"]["header_bg"]
-            shape.line.color.rgb = self.config["COLOR"]["text"]
-            shape.line.width = Pt(0.75)
-
-            text_frame = shape.text_frame
-            text_frame.text = full_title
-            text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-            text_frame.word_wrap = True
-
-            p = text_frame.paragraphs[0]
-            p.alignment = PP_ALIGN.LEFT
-            run = p.runs[0]
-            run.font.size = self.config["SIZE"]["song_list"]
-            run.font.name = self.config["FONT"]["body"]
-            run.font.color.rgb = self.config["COLOR"]["text"]
-
             try:
-                shape.click_action.target_slide = song_slide_map[index]
+                target_slide = song_slide_map[index]
             except Exception as e:
                 print(f"Error linking '{full_title}' to slide: {e}")
+                target_slide = None
+            entries.append((full_title, target_slide))
 
             number_index_map[song_number] = index
 
-        return slide, number_index_map
+        return self._add_index_slide(entries), number_index_map
 
     def _add_alpha_index_slide(self,
                                alpha_order: List[Tuple[int, str]],
@@ -185,52 +423,24 @@ class LyricsSlideshow:
                                number_index_map: Dict[int, int]
                                ) -> Slide:
         """Creates an alphabetically ordered index slide."""
-        slide = self.prs.slides.add_slide(self.blank_layout)
-        slide.background.fill.solid()
-        slide.background.fill.fore_color.rgb = self.config["COLOR"]["header_bg"]
+        entries = []
 
-        grid = self.config["GRID"]
-        num_columns = grid["columns"]
-        box_width = grid["box_width"]
-        box_height = grid["box_height"]
-
-        for index, (song_number, title) in enumerate(alpha_order):
-            col = index % num_columns
-            row = index // num_columns
+        for song_number, title in alpha_order:
             num_str = f"{song_number:2}"
             full_title = f"{num_str} – {title}"
 
-            left = grid["start_left"] + col * (grid["box_width"] + grid["spacing_x"])
-            top = grid["start_top"] + row * (grid["box_height"] + grid["spacing_y"])
-
-            shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, box_width, box_height)
-            shape.fill.solid()
-            shape.fill.fore_color.rgb = self.config["COLOR"]["header_bg"]
-            shape.line.color.rgb = self.config["COLOR"]["text"]
-            shape.line.width = Pt(0.75)
-
-            text_frame = shape.text_frame
-            text_frame.text = full_title
-            text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.MIDDLE
-            text_frame.word_wrap = True
-            
-            p = text_frame.paragraphs[0]
-            p.alignment = PP_ALIGN.LEFT
-            run = p.runs[0]
-            run.font.size = self.config["SIZE"]["song_list"]
-            run.font.name = self.config["FONT"]["body"]
-            run.font.color.rgb = self.config["COLOR"]["text"]
-
+            target_slide = None
             if song_number in number_index_map:
                 song_index = number_index_map[song_number]
                 try:
-                    shape.click_action.target_slide = song_slide_map[song_index]
+                    target_slide = song_slide_map[song_index]
                 except Exception as e:
                     print(f"Error linking '{full_title}' in alpha index: {e}")
             else:
                 print(f"Warning: No match for song number {song_number} ({title})")
+            entries.append((full_title, target_slide))
 
-        return slide
+        return self._add_index_slide(entries)
 
     def create_presentation_from_parsed_sections(self,
                                                  songs: List[Tuple[int, str, int, List[Dict]]],
@@ -245,67 +455,83 @@ class LyricsSlideshow:
 
         song_titles = [title for _, title, _, _ in songs]
         song_slide_map = {}  # Map song index -> first slide
+        home_icons = []  # Linked to the song list slide once it exists
 
         # --- Create Lyric Slides ---
+        # Enum members, layout values and methods used on every slide, looked up once
+        align_left, align_right = PP_ALIGN.LEFT, PP_ALIGN.RIGHT
+        anchor_top = MSO_VERTICAL_ANCHOR.TOP
+        position, size = self.config["POSITION"], self.config["SIZE"]
+        left_margin, bottom_margin = position["left_margin"], position["bottom_margin"]
+        header_height, header_size = position["header_height"], size["header"]
+        add_slide, add_text_box, add_icon = self._add_slide, self._add_text_box, self._add_icon
+        add_header_background = self._add_header_background
+
         for index, (song_number, title, chorus_count, sections) in enumerate(songs):
+            # Header text is uppercase; the song's part is the same on all its slides
+            song_header = f"{song_number}: {title}".upper()
+            # Choruses are only numbered when the song has more than one
+            number_choruses = chorus_count > 1
+            first_slide = None  # The song's first slide; index links and its restart icon jump here
+
             for slide_index, section in enumerate(sections):
                 lines = section["content"].splitlines()
                 # Split long sections into chunks of 9 lines (10 was splitting 10, not max 9)
                 chunks = [lines[i:i+9] for i in range(0, len(lines), 9)]
                 if not chunks: chunks = [[""]] # Handle empty sections
 
+                # The label and styling depend only on the section, not the chunk
+                is_chorus = (section["type"] == "chorus")
+                base_label = _section_label(is_chorus, section["number"], number_choruses)
+                lyrics_size = size["chorus"] if is_chorus else size["stanza"]
+
                 for chunk_index, chunk in enumerate(chunks):
-                    slide = self.prs.slides.add_slide(self.blank_layout)
-                    if slide_index == 0 and chunk_index == 0:
-                        song_slide_map[index] = slide
+                    slide = add_slide()
+                    if first_slide is None:
+                        first_slide = song_slide_map[index] = slide
 
-                    slide.background.fill.solid()
-                    slide.background.fill.fore_color.rgb = self.config["COLOR"]["bg"]
-                    self._add_header_background(slide)
+                    add_header_background(slide)
 
                     # Header left: Song number + title
-                    self._add_text_box(
-                        slide=slide, text=f"{song_number}: {title}",
-                        left=self.config["POSITION"]["left_margin"], top=self.config["POSITION"]["bottom_margin"],
-                        width=self.config["POSITION"]["header_width_left"], height=self.config["POSITION"]["header_height"],
-                        font_size=self.config["SIZE"]["header"], horizontal_alignment=PP_ALIGN.LEFT,
+                    add_text_box(
+                        slide=slide, text=song_header,
+                        left=left_margin, top=bottom_margin,
+                        width=position["header_width_left"], height=header_height,
+                        font_size=header_size, horizontal_alignment=align_left,
                         is_header=True, font_type="header"
                     )
 
                     # Header right: section label
-                    section_type = section["type"].upper()
-                    if section_type == "CHORUS":
-                        section_label = f"CHORUS {section['number']}" if chorus_count > 1 else "CHORUS"
-                    else:
-                        section_label = f"STANZA {section['number']}"
+                    section_label = base_label
                     if len(chunks) > 1:
                         section_label += f" ({chunk_index + 1}/{len(chunks)})"
 
-                    self._add_text_box(
+                    add_text_box(
                         slide=slide, text=section_label,
-                        left=self.config["POSITION"]["header_left"], top=self.config["POSITION"]["bottom_margin"],
-                        width=self.config["POSITION"]["header_width_right"], height=self.config["POSITION"]["header_height"],
-                        font_size=self.config["SIZE"]["header"], horizontal_alignment=PP_ALIGN.RIGHT,
+                        left=position["header_left"], top=bottom_margin,
+                        width=position["header_width_right"], height=header_height,
+                        font_size=header_size, horizontal_alignment=align_right,
                         is_header=True, font_type="header"
                     )
 
                     # Add home icon (target TBD)
-                    self._add_icon(slide, target_slide=None, icon_path="assets/home.png", icon_type="home")
+                    home_icon = add_icon(slide, target_slide=None, icon_path="assets/home.png", icon_type="home")
+                    if home_icon is not None:
+                        home_icons.append(home_icon)
 
                     # Add lyrics box
-                    is_chorus = (section["type"] == "chorus")
-                    self._add_text_box(
-                        slide=slide, text="\n".join(chunk),
-                        left=self.config["POSITION"]["left_margin"], top=self.config["POSITION"]["lyrics_top"],
-                        width=self.config["POSITION"]["lyrics_width"], height=self.config["POSITION"]["lyrics_height"],
-                        font_size=self.config["SIZE"]["stanza"] if not is_chorus else self.config["SIZE"]["chorus"],
-                        vertical_alignment=MSO_VERTICAL_ANCHOR.TOP,
+                    add_text_box(
+                        slide=slide, text=None, lines=chunk,
+                        left=left_margin, top=position["lyrics_top"],
+                        width=position["lyrics_width"], height=position["lyrics_height"],
+                        font_size=lyrics_size,
+                        vertical_alignment=anchor_top,
                         is_chorus=is_chorus
                     )
 
                     # Add restart icon on last slide of song
                     if slide_index == len(sections) - 1 and chunk_index == len(chunks) - 1:
-                         self._add_icon(slide, target_slide=song_slide_map[index], icon_path="assets/restart.png", icon_type="restart")
+                         add_icon(slide, target_slide=first_slide, icon_path="assets/restart.png", icon_type="restart")
 
 
         # --- Create Index Slides ---
@@ -314,12 +540,10 @@ class LyricsSlideshow:
 
         # --- Patch Home Icons ---
         # Now that song_list_slide exists, link all home icons to it
-        for slide in self.prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "click_action"):
-                    # Find shapes with a click action but no target (our home icons)
-                    if getattr(shape.click_action, "target_slide", None) is None:
-                        shape.click_action.target_slide = song_list_slide
-
-        self.prs.save(output_file)
+        for home_icon in home_icons:
+            home_icon.click_action.target_slide = song_list_slide
+
+        # A 1 MiB buffer turns the zip writer's many small writes into a few large ones
+        with _fast_deflate(), open(output_file, "wb", buffering=1024 * 1024) as f:
+            self.prs.save(f)
         return output_file
\ No newline at end of file
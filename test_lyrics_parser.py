@@ -0,0 +1,29 @@
+import unittest
+
+from lyrics_parser import clean_lyrics
+
+
+class TestCleanLyrics(unittest.TestCase):
+    def test_drops_metadata_and_chords(self):
+        text = "# hashtag\nCapo 3\n(c) 2020 Someone\nreal [G]line\n  chorus [C]line  "
+        self.assertEqual(clean_lyrics(text), "real line\n  chorus line")
+
+    def test_carriage_return_line_breaks(self):
+        text = "Line one\r# meta\rcapo 2\rreal [G]line"
+        self.assertEqual(clean_lyrics(text), "Line one\nreal line")
+
+    def test_crlf_line_breaks(self):
+        text = "Line one\r\n(c) 2020 Someone\r\n  chorus [C]line  \r\n"
+        self.assertEqual(clean_lyrics(text), "Line one\n  chorus line")
+
+    def test_unicode_line_breaks(self):
+        self.assertEqual(clean_lyrics("a\u2028# m\u2028b"), "a\nb")
+        self.assertEqual(clean_lyrics("a\x0c# m\nb"), "a\nb")
+        self.assertEqual(clean_lyrics("a\x85capo 1\x1eb"), "a\nb")
+
+    def test_chords_do_not_span_line_breaks(self):
+        self.assertEqual(clean_lyrics("a [G\rCapo 1\rb]"), "a [G\nb]")
+
+
+if __name__ == "__main__":
+    unittest.main()
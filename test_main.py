@@ -0,0 +1,24 @@
+import platform
+import unittest
+from unittest import mock
+
+import main
+
+
+class TestOpenFile(unittest.TestCase):
+    def test_linux_without_an_opener_does_not_raise(self):
+        with mock.patch.object(main.subprocess, "Popen", side_effect=FileNotFoundError) as popen, \
+                mock.patch("builtins.print") as printed:
+            main._open_on_linux("lyrics_slideshow.pptx")
+        self.assertEqual([call.args[0][0] for call in popen.call_args_list], ["xdg-open", "wslview"])
+        printed.assert_called_once()
+
+    @unittest.skipUnless(platform.system() == "Linux", "_open_file only uses xdg-open/wslview on Linux")
+    def test_open_file_without_an_opener_does_not_raise(self):
+        with mock.patch.object(main.subprocess, "Popen", side_effect=FileNotFoundError), \
+                mock.patch("builtins.print"):
+            main._open_file("lyrics_slideshow.pptx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,251 @@
+import os
+import shutil
+import tempfile
+import types
+import unittest
+import zipfile
+import zlib
+from unittest import mock
+
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.enum.text import MSO_VERTICAL_ANCHOR
+from pptx.util import Pt
+
+from alpha_order_songs import generate_alphabetical_index
+from config import POSITION, ICON_SIZES, ICON_POSITIONS, GRID
+from lyrics_parser import parse_and_clean
+import slideshow as slideshow_module
+from slideshow import LyricsSlideshow
+
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SONGS = [
+    ("Amazing Grace", "1\nAmazing grace, how sweet the sound\nThat saved a wretch like me\n\n"
+                      "  I once was lost\n  But now am found\n\n"
+                      "2\n'Twas grace that taught my heart to fear\nAnd grace my fears relieved"),
+    ("Be Thou My Vision", "1\n" + "\n".join(f"Line {i} of a long stanza" for i in range(1, 13))),
+    ("Come Thou Fount", "1\nCome, Thou Fount of every blessing\n\n  Chorus one\n\n"
+                        "2\nStreams of mercy\n\n  Chorus two"),
+]
+
+
+def make_config():
+    """The defaults configure_defaults() returns, without its interactive menu."""
+    return {
+        "FONT": {"title": "Grathik", "body": "Grathik", "header": "Grathik"},
+        "SIZE": {k: Pt(v) for k, v in {"title": 44, "header": 24, "stanza": 44, "chorus": 44, "song_list": 14}.items()},
+        "COLOR": {k: RGBColor.from_string(v) for k, v in
+                  {"bg": "1E6B2C", "header_bg": "F2C037", "text": "FFFFFF", "header_text": "2D1412"}.items()},
+        "backheadfil": "y",
+        "POSITION": POSITION,
+        "ICON_SIZES": ICON_SIZES,
+        "ICON_POSITIONS": ICON_POSITIONS,
+        "GRID": GRID,
+    }
+
+
+def make_songs(songs=SONGS):
+    """Song tuples in the shape match_and_compile_songs produces them."""
+    tuples = []
+    for number, (title, lyrics) in enumerate(songs, 1):
+        chorus_count, sections = parse_and_clean(lyrics)
+        tuples.append((number, title, chorus_count, sections))
+    return tuples
+
+
+class SlideshowTestCase(unittest.TestCase):
+    def setUp(self):
+        # Icons are loaded from assets/ relative to the working directory
+        self.old_cwd = os.getcwd()
+        os.chdir(REPO_DIR)
+        self.tmp_dir = tempfile.mkdtemp()
+        self.output = os.path.join(self.tmp_dir, "test_slideshow.pptx")
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.tmp_dir)
+
+    def build_deck(self, songs=None, slideshow=None):
+        songs = make_songs() if songs is None else songs
+        slideshow = LyricsSlideshow(make_config()) if slideshow is None else slideshow
+        alpha = generate_alphabetical_index([(number, title) for number, title, *_ in songs])
+        path = slideshow.create_presentation_from_parsed_sections(songs, alpha, self.output)
+        return Presentation(path)
+
+
+class TestTextBoxTemplates(unittest.TestCase):
+    """Boxes cloned from a cached template must match what the uncached path builds."""
+
+    def add_lyrics_box(self, slideshow, lines, is_chorus=False):
+        return slideshow._add_text_box(
+            slide=slideshow._add_slide(), text=None, lines=lines,
+            left=POSITION["left_margin"], top=POSITION["lyrics_top"],
+            width=POSITION["lyrics_width"], height=POSITION["lyrics_height"],
+            font_size=Pt(44), vertical_alignment=MSO_VERTICAL_ANCHOR.TOP, is_chorus=is_chorus)
+
+    def assert_clone_matches_uncached(self, lines, primer, is_chorus=False):
+        # The first box of a style always takes the uncached path
+        uncached = self.add_lyrics_box(LyricsSlideshow(make_config()), lines, is_chorus)
+
+        # A primer with the same empty-line layout leaves a template for lines to reuse
+        slideshow = LyricsSlideshow(make_config())
+        self.add_lyrics_box(slideshow, primer, is_chorus)
+        self.assertEqual(len(slideshow._textbox_templates), 1)
+        cloned = self.add_lyrics_box(slideshow, lines, is_chorus)
+
+        self.assertEqual(etree.tostring(cloned._element.txBody), etree.tostring(uncached._element.txBody))
+        return cloned
+
+    def test_mixed_empty_and_non_empty_lines(self):
+        lines = ["Line one", "", "Line three", "", ""]
+        cloned = self.assert_clone_matches_uncached(lines, ["x", "", "y", "", ""])
+        self.assertEqual([p.text for p in cloned.text_frame.paragraphs], lines)
+
+    def test_whitespace_only_line(self):
+        lines = ["First", "   ", "Third"]
+        cloned = self.assert_clone_matches_uncached(lines, ["a", "b", "c"])
+        self.assertEqual([p.text for p in cloned.text_frame.paragraphs], lines)
+
+    def test_empty_section(self):
+        self.assert_clone_matches_uncached([""], [""])
+
+    def test_line_with_control_character_is_not_cloned(self):
+        for line in ("Soft\vbreak", "Bell\x07line"):
+            with self.subTest(line=line):
+                self.assert_clone_matches_uncached(["Before", line], ["a", "b"])
+
+    def test_repeated_chorus(self):
+        chorus = ["  Jesus, living Word,", "  My heart thirsts for Thee."]
+        slideshow = LyricsSlideshow(make_config())
+        first = self.add_lyrics_box(slideshow, chorus, is_chorus=True)
+        self.add_lyrics_box(slideshow, ["Stanza line", "Another line"])
+        repeat = self.add_lyrics_box(slideshow, chorus, is_chorus=True)
+
+        self.assertEqual(len(slideshow._textbox_templates), 2)
+        self.assertEqual(etree.tostring(repeat._element.txBody), etree.tostring(first._element.txBody))
+        self.assertTrue(all(run.font.italic for p in repeat.text_frame.paragraphs for run in p.runs))
+
+
+class TestSlideAppending(SlideshowTestCase):
+    def assert_unique_slide_ids(self, prs):
+        sldIds = list(prs.slides._sldIdLst)
+        rIds = [sldId.rId for sldId in sldIds]
+        partnames = [prs.part.related_part(rId).partname for rId in rIds]
+        self.assertEqual(len({sldId.id for sldId in sldIds}), len(sldIds))
+        self.assertEqual(len(set(rIds)), len(rIds))
+        self.assertEqual(len(set(partnames)), len(partnames))
+        self.assertEqual(sorted(partnames), sorted(f"/ppt/slides/slide{i}.xml" for i in range(1, len(sldIds) + 1)))
+
+    def test_reopened_deck_has_unique_slide_ids_rids_and_partnames(self):
+        prs = self.build_deck()
+        # Title slide, one slide per section chunk, and the two index slides
+        self.assertEqual(len(prs.slides), 1 + 3 + 2 + 4 + 2)
+        self.assert_unique_slide_ids(prs)
+
+    def test_public_add_slide_fallback_builds_the_same_deck(self):
+        direct = [[shape.name for shape in slide.shapes] for slide in self.build_deck().slides]
+        slideshow = LyricsSlideshow(make_config())
+        slideshow._direct_slides = False
+        prs = self.build_deck(slideshow=slideshow)
+        self.assert_unique_slide_ids(prs)
+        self.assertEqual([[shape.name for shape in slide.shapes] for slide in prs.slides], direct)
+
+
+class TestClonedShapes(SlideshowTestCase):
+    def test_shape_names_are_numbered_from_their_ids(self):
+        prs = self.build_deck()
+        for slide in prs.slides:
+            names = [shape.name for shape in slide.shapes]
+            self.assertEqual(len(names), len(set(names)))
+            for shape in slide.shapes:
+                self.assertEqual(shape.name.rpartition(" ")[2], str(shape.shape_id - 1))
+
+    def test_index_grid_boxes_are_named_in_order(self):
+        prs = self.build_deck()
+        index_slides = list(prs.slides)[-2:]
+        for slide in index_slides:
+            names = [shape.name for shape in slide.shapes]
+            self.assertEqual(names, [f"Rectangle {i}" for i in range(1, len(SONGS) + 1)])
+
+
+class TestSlideLinks(SlideshowTestCase):
+    def assert_links_resolve(self, prs):
+        slides = list(prs.slides)
+        song_list_slide, alpha_index_slide = slides[-2:]
+        # Each song's slides open with its "N: TITLE" header box; index boxes link to the first
+        first_slides = {}
+        for slide in slides[1:-2]:
+            first_slides.setdefault(slide.shapes[1].text_frame.text, slide.slide_id)
+
+        for index_slide in (song_list_slide, alpha_index_slide):
+            self.assertEqual(len(index_slide.shapes), len(SONGS))
+            for box in index_slide.shapes:
+                number, _, title = box.text_frame.text.partition(" – ")
+                header = f"{number.strip()}: {title.upper()}"
+                self.assertEqual(box.click_action.target_slide.slide_id, first_slides[header])
+
+        for slide in slides[1:-2]:
+            pictures = [shape for shape in slide.shapes if shape.shape_type == MSO_SHAPE_TYPE.PICTURE]
+            self.assertEqual(pictures[0].click_action.target_slide.slide_id, song_list_slide.slide_id)
+            if len(pictures) > 1:  # Restart icon, on a song's last slide
+                restart_target = pictures[1].click_action.target_slide.slide_id
+                self.assertEqual(restart_target, first_slides[slide.shapes[1].text_frame.text])
+
+    def test_index_and_icon_links_resolve_after_reopening(self):
+        self.assert_links_resolve(self.build_deck())
+
+    def test_public_click_action_fallback_links_the_same_slides(self):
+        slideshow = LyricsSlideshow(make_config())
+        slideshow._direct_links = False
+        self.assert_links_resolve(self.build_deck(slideshow=slideshow))
+
+
+class TestFastDeflate(SlideshowTestCase):
+    def assert_valid_deck(self):
+        with zipfile.ZipFile(self.output) as archive:
+            self.assertIsNone(archive.testzip())
+        self.assertEqual(len(Presentation(self.output).slides), 1 + 3 + 2 + 4 + 2)
+
+    def test_save_uses_isal_zlib_when_available(self):
+        # A stand-in for isal_zlib that records the compressors zipfile asks for
+        levels = []
+        stub = types.ModuleType("isal_zlib")
+        stub.__dict__.update({name: getattr(zlib, name) for name in dir(zlib) if not name.startswith("__")})
+
+        def compressobj(level, *args):
+            levels.append(level)
+            return zlib.compressobj(level, *args)
+
+        stub.compressobj = compressobj
+        with mock.patch.object(slideshow_module, "isal_zlib", stub):
+            self.build_deck()
+
+        self.assertTrue(levels)
+        self.assertEqual(set(levels), {1})
+        self.assertIs(zipfile.zlib, zlib)  # Restored once the save is done
+        self.assert_valid_deck()
+
+    def test_save_without_isal_uses_zlib(self):
+        with mock.patch.object(slideshow_module, "isal_zlib", None):
+            self.build_deck()
+        self.assertIs(zipfile.zlib, zlib)
+        self.assert_valid_deck()
+
+    @unittest.skipIf(isal_zlib is None, "isal is not installed")
+    def test_save_with_isal(self):
+        with mock.patch.object(slideshow_module, "isal_zlib", isal_zlib):
+            self.build_deck()
+        self.assertIs(zipfile.zlib, zlib)
+        self.assert_valid_deck()
+
+
+if __name__ == "__main__":
+    unittest.main()
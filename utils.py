@@ -1,18 +1,58 @@
 # utils.py
+import json
+import os
+from functools import lru_cache
+from typing import Any, List
+
 from pptx.util import Pt
 
-def calculate_dynamic_font_size(text: str, is_chorus: bool = False) -> Pt:
+try:
+    import orjson  # Optional: much faster JSON parsing and encoding
+except ImportError:
+    orjson = None
+
+def load_json(path: str) -> Any:
     """
-    Estimate font size based on text length to avoid overflow.
+    Read a JSON file in one binary read and parse it (orjson if installed).
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def save_json(path: str, obj: Any) -> None:
+    """
+    Encode obj as indented UTF-8 JSON and write it to path in a single call.
+    The payload goes to a temporary file first and is then renamed over path,
+    so an interrupted run never leaves a half-written cache behind.
+    """
+    if orjson:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+def count_visual_lines(lines: List[str], max_chars_per_line: int = 50) -> int:
+    """
+    Count the visual lines of already split text: one per line plus its wraps.
+    """
+    estimated_lines = len(lines)
+    # Lines can only wrap if the text (without line breaks) is at least one line long
+    if sum(map(len, lines)) >= max_chars_per_line:
+        estimated_lines += sum(len(line) // max_chars_per_line for line in lines)
+    return estimated_lines
+
+@lru_cache(maxsize=64)
+def font_size_for_lines(estimated_lines: int, is_chorus: bool = False) -> Pt:
+    """
+    Font size for text taking up estimated_lines visual lines.
+    Only a few dozen line counts ever occur, so the sizes are cached.
     """
     base_size = 28
     min_size = 18
     max_lines = 12 if is_chorus else 14
-    max_chars_per_line = 50  # Empirical guess
-
-    # Count actual visual lines based on wrap
-    raw_lines = text.split('\n')
-    estimated_lines = sum((len(line) // max_chars_per_line + 1) for line in raw_lines)
 
     scale = min(1.0, max_lines / max(estimated_lines, 1))
     size = int(base_size * scale)